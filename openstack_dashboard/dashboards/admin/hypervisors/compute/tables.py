@@ -91,7 +91,8 @@ class ComputeHostFilterAction(tables.FilterAction):
     def filter(self, table, services, filter_string):
         q = filter_string.lower()
 
-        return filter(lambda service: q in service.host.lower(), services)
+        return [service for service in services
+                if q in service.host.lower()]
 
 
 class ComputeHostTable(tables.DataTable):
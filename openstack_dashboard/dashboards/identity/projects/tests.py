@@ -98,6 +98,26 @@ class TenantsViewTests(test.BaseAdminViewTests):
         self.mock_domain_lookup.assert_called_once_with(test.IsHttpRequest())
         self.mock_enabled_quotas.assert_called_once_with(test.IsHttpRequest())
 
+    @test.create_mocks({api.keystone: ('get_effective_domain_id',
+                                       'tenant_list',
+                                       'domain_lookup')})
+    def test_index_no_projects(self):
+        self.mock_tenant_list.return_value = [[], False]
+        self.mock_get_effective_domain_id.return_value = None
+
+        res = self.client.get(INDEX_URL)
+        self.assertTemplateUsed(res, 'identity/projects/index.html')
+        self.assertCountEqual(res.context['table'].data, [])
+
+        self.mock_get_effective_domain_id.assert_called_once_with(
+            test.IsHttpRequest())
+        self.mock_tenant_list.assert_called_once_with(test.IsHttpRequest(),
+                                                      domain=None,
+                                                      paginate=True,
+                                                      filters={},
+                                                      marker=None)
+        self.mock_domain_lookup.assert_not_called()
+
     @test.update_settings(FILTER_DATA_FIRST={'identity.projects': True})
     def test_index_with_filter_first(self):
         res = self.client.get(INDEX_URL)
@@ -302,7 +322,7 @@ class CreateProjectWorkflowTests(test.BaseAdminViewTests):
         self.mock_user_list.assert_called_once_with(test.IsHttpRequest(),
                                                     domain=domain_id)
         self.assert_mock_multiple_calls_with_same_arguments(
-            self.mock_role_list, 6,
+            self.mock_role_list, 5,
             mock.call(test.IsHttpRequest()))
         self.mock_group_list.assert_called_once_with(test.IsHttpRequest(),
                                                      domain=domain_id)
@@ -436,7 +456,7 @@ class CreateProjectWorkflowTests(test.BaseAdminViewTests):
         self.mock_user_list.assert_called_once_with(test.IsHttpRequest(),
                                                     domain=domain_id)
         self.assert_mock_multiple_calls_with_same_arguments(
-            self.mock_role_list, 6,
+            self.mock_role_list, 5,
             mock.call(test.IsHttpRequest()))
         self.mock_group_list.assert_called_once_with(test.IsHttpRequest(),
                                                      domain=domain_id)
@@ -809,6 +829,42 @@ class UpdateProjectWorkflowTests(test.BaseAdminViewTests):
             self.mock_role_assignments_list, 3,
             mock.call(test.IsHttpRequest(), project=self.tenant.id))
 
+    @test.create_mocks({api.keystone: ('get_default_role',
+                                       'tenant_get',
+                                       'domain_get',
+                                       'user_list',
+                                       'role_list',
+                                       'get_project_users_roles')})
+    def test_update_project_get_role_list_error(self):
+        project = self.tenants.first()
+        domain_id = project.domain_id
+
+        self.mock_get_default_role.return_value = self.roles.first()
+        self.mock_tenant_get.return_value = project
+        self.mock_domain_get.return_value = self.domain
+        self.mock_user_list.return_value = self._get_all_users(domain_id)
+        self.mock_role_list.side_effect = self.exceptions.keystone
+        self.mock_get_project_users_roles.return_value = {}
+
+        url = reverse('horizon:identity:projects:update',
+                      args=[self.tenant.id])
+
+        try:
+            # Avoid the log message in the test output when the workflow's
+            # step action cannot be instantiated
+            logging.disable(logging.ERROR)
+            res = self.client.get(url)
+        finally:
+            logging.disable(logging.NOTSET)
+
+        self.assertRedirectsNoFollow(res, INDEX_URL)
+
+        self.mock_user_list.assert_called_once_with(test.IsHttpRequest(),
+                                                    domain=domain_id)
+        self.mock_role_list.assert_called_once_with(test.IsHttpRequest())
+        self.mock_get_project_users_roles.assert_called_once_with(
+            test.IsHttpRequest(), self.tenant.id)
+
     @test.create_mocks({api.keystone: ('tenant_get',)})
     def test_update_project_get_error(self):
         self.mock_tenant_get.side_effect = self.exceptions.nova
@@ -1017,7 +1073,23 @@ class UpdateQuotasWorkflowTests(test.BaseAdminViewTests):
         self.mock_get_disabled_quotas.assert_called_once_with(
             test.IsHttpRequest())
         self.mock_get_tenant_quota_data.assert_called_once_with(
-            test.IsHttpRequest(), tenant_id=self.tenant.id)
+            test.IsHttpRequest(), tenant_id=self.tenant.id,
+            disabled_quotas=set())
+
+    @test.create_mocks({quotas: ('get_tenant_quota_data',
+                                 'get_disabled_quotas')})
+    def test_update_quotas_get_disabled_quotas_error(self):
+        self.mock_get_disabled_quotas.side_effect = self.exceptions.nova
+
+        url = reverse('horizon:identity:projects:update_quotas',
+                      args=[self.tenant.id])
+        res = self.client.get(url)
+
+        self.assertRedirectsNoFollow(res, INDEX_URL)
+
+        self.mock_get_disabled_quotas.assert_called_once_with(
+            test.IsHttpRequest())
+        self.mock_get_tenant_quota_data.assert_not_called()
 
     @test.create_mocks({
         api.nova: (('tenant_quota_update', 'nova_tenant_quota_update'),),
@@ -1071,7 +1143,8 @@ class UpdateQuotasWorkflowTests(test.BaseAdminViewTests):
         self.mock_get_disabled_quotas.assert_called_once_with(
             test.IsHttpRequest())
         self.mock_get_tenant_quota_data.assert_called_once_with(
-            test.IsHttpRequest(), tenant_id=self.tenant.id)
+            test.IsHttpRequest(), tenant_id=self.tenant.id,
+            disabled_quotas=set())
         nova_updated_quota = {key: updated_quota[key] for key
                               in quotas.NOVA_QUOTA_FIELDS}
         self.mock_nova_tenant_quota_update.assert_called_once_with(
@@ -1144,7 +1217,8 @@ class UpdateQuotasWorkflowTests(test.BaseAdminViewTests):
         self.mock_get_disabled_quotas.assert_called_once_with(
             test.IsHttpRequest())
         self.mock_get_tenant_quota_data.assert_called_once_with(
-            test.IsHttpRequest(), tenant_id=self.tenant.id)
+            test.IsHttpRequest(), tenant_id=self.tenant.id,
+            disabled_quotas=set())
         self.mock_tenant_quota_usages.assert_has_calls([
             mock.call(test.IsHttpRequest(), tenant_id=project.id,
                       targets=tuple(quotas.NOVA_QUOTA_FIELDS)),
@@ -131,9 +131,13 @@ class IndexView(tables.DataTableView):
                 _("Insufficient privilege level to view project information.")
             messages.info(self.request, msg)
 
-        domain_lookup = api.keystone.domain_lookup(self.request)
-        for t in tenants:
-            t.domain_name = domain_lookup.get(t.domain_id)
+        # Resolve all domain names with a single lookup so that rendering
+        # the table rows does not need a Keystone request per project.
+        # Skip it when there is nothing to display.
+        if tenants:
+            domain_lookup = api.keystone.domain_lookup(self.request)
+            for t in tenants:
+                t.domain_name = domain_lookup.get(t.domain_id)
 
         return tenants
 
@@ -217,17 +221,21 @@ class UpdateQuotasView(workflows.WorkflowView):
         project_id = self.kwargs['tenant_id']
         initial['project_id'] = project_id
         try:
+            disabled_quotas = quotas.get_disabled_quotas(self.request)
             # get initial project quota
             if keystone.is_cloud_admin(self.request):
-                quota_data = quotas.get_tenant_quota_data(self.request,
-                                                          tenant_id=project_id)
+                # NOTE: get_tenant_quota_data() adds the quotas it fails to
+                # retrieve to the given set, so pass a copy of it.
+                quota_data = quotas.get_tenant_quota_data(
+                    self.request, tenant_id=project_id,
+                    disabled_quotas=set(disabled_quotas))
                 for field in quotas.QUOTA_FIELDS:
                     initial[field] = quota_data.get(field).limit
         except Exception:
             exceptions.handle(self.request,
                               _('Unable to retrieve project quotas.'),
                               redirect=reverse(INDEX_URL))
-        initial['disabled_quotas'] = quotas.get_disabled_quotas(self.request)
+        initial['disabled_quotas'] = disabled_quotas
         return initial
 
 
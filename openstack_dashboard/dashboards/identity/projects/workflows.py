@@ -36,6 +36,7 @@ from openstack_dashboard.api import cinder
 from openstack_dashboard.api import keystone
 from openstack_dashboard.api import nova
 from openstack_dashboard.usage import quotas
+from openstack_dashboard.utils import futurist_utils
 from openstack_dashboard.utils import identity
 
 LOG = logging.getLogger(__name__)
@@ -262,6 +263,14 @@ class CreateProjectInfo(workflows.Step):
         self.contributes += tuple(EXTRA_INFO.keys())
 
 
+def _get_role_list(request, err_msg):
+    try:
+        return api.keystone.role_list(request)
+    except Exception:
+        exceptions.handle(request, err_msg, redirect=reverse(INDEX_URL))
+        return []
+
+
 class UpdateProjectMembersAction(workflows.MembershipAction):
     def __init__(self, request, *args, **kwargs):
         super().__init__(request, *args, **kwargs)
@@ -290,23 +299,15 @@ class UpdateProjectMembersAction(workflows.MembershipAction):
         self.fields[default_role_name] = forms.CharField(required=False)
         self.fields[default_role_name].initial = default_role.id
 
-        # Get list of available users
-        all_users = []
-        try:
-            all_users = api.keystone.user_list(request,
-                                               domain=domain_id)
-        except Exception:
-            exceptions.handle(request, err_msg)
+        # The available users, roles and the current project members are
+        # independent Keystone calls, so retrieve them in parallel.
+        all_users, role_list, users_roles = \
+            futurist_utils.call_functions_parallel(
+                (self._get_users, [domain_id, err_msg]),
+                (_get_role_list, [request, err_msg]),
+                (self._get_users_roles, [project_id, err_msg]))
         users_list = [(user.id, user.name) for user in all_users]
 
-        # Get list of roles
-        role_list = []
-        try:
-            role_list = api.keystone.role_list(request)
-        except Exception:
-            exceptions.handle(request,
-                              err_msg,
-                              redirect=reverse(INDEX_URL))
         for role in role_list:
             field_name = self.get_member_field_name(role.id)
             label = role.name
@@ -317,20 +318,31 @@ class UpdateProjectMembersAction(workflows.MembershipAction):
 
         # Figure out users & roles
         if project_id:
-            try:
-                users_roles = api.keystone.get_project_users_roles(request,
-                                                                   project_id)
-            except Exception:
-                exceptions.handle(request,
-                                  err_msg,
-                                  redirect=reverse(INDEX_URL))
-
             for user_id in users_roles:
                 roles_ids = users_roles[user_id]
                 for role_id in roles_ids:
                     field_name = self.get_member_field_name(role_id)
                     self.fields[field_name].initial.append(user_id)
 
+    def _get_users(self, domain_id, err_msg):
+        try:
+            return api.keystone.user_list(self.request, domain=domain_id)
+        except Exception:
+            exceptions.handle(self.request, err_msg)
+            return []
+
+    def _get_users_roles(self, project_id, err_msg):
+        if not project_id:
+            return {}
+        try:
+            return api.keystone.get_project_users_roles(self.request,
+                                                        project_id)
+        except Exception:
+            exceptions.handle(self.request,
+                              err_msg,
+                              redirect=reverse(INDEX_URL))
+            return {}
+
     class Meta(object):
         name = _("Project Members")
         slug = PROJECT_USER_MEMBER_SLUG
@@ -385,26 +397,18 @@ class UpdateProjectGroupsAction(workflows.MembershipAction):
         self.fields[default_role_name] = forms.CharField(required=False)
         self.fields[default_role_name].initial = default_role.id
 
-        # Get list of available groups
-        all_groups = []
-        try:
-            all_groups = api.keystone.group_list(request,
-                                                 domain=domain_id)
-        except Exception:
-            exceptions.handle(request, err_msg)
+        # The available groups, roles and the current project groups are
+        # independent Keystone calls, so retrieve them in parallel.
+        all_groups, role_list, groups_roles = \
+            futurist_utils.call_functions_parallel(
+                (self._get_groups, [domain_id, err_msg]),
+                (_get_role_list, [request, err_msg]),
+                (self._get_groups_roles, [project_id, err_msg]))
         # some backends (e.g. LDAP) do not provide group names
         groups_list = [
             (group.id, getattr(group, 'name', group.id))
             for group in all_groups]
 
-        # Get list of roles
-        role_list = []
-        try:
-            role_list = api.keystone.role_list(request)
-        except Exception:
-            exceptions.handle(request,
-                              err_msg,
-                              redirect=reverse(INDEX_URL))
         for role in role_list:
             field_name = self.get_member_field_name(role.id)
             label = role.name
@@ -415,20 +419,31 @@ class UpdateProjectGroupsAction(workflows.MembershipAction):
 
         # Figure out groups & roles
         if project_id:
-            try:
-                groups_roles = api.keystone.get_project_groups_roles(
-                    request, project_id)
-            except Exception:
-                exceptions.handle(request,
-                                  err_msg,
-                                  redirect=reverse(INDEX_URL))
-
             for group_id in groups_roles:
                 roles_ids = groups_roles[group_id]
                 for role_id in roles_ids:
                     field_name = self.get_member_field_name(role_id)
                     self.fields[field_name].initial.append(group_id)
 
+    def _get_groups(self, domain_id, err_msg):
+        try:
+            return api.keystone.group_list(self.request, domain=domain_id)
+        except Exception:
+            exceptions.handle(self.request, err_msg)
+            return []
+
+    def _get_groups_roles(self, project_id, err_msg):
+        if not project_id:
+            return {}
+        try:
+            return api.keystone.get_project_groups_roles(self.request,
+                                                         project_id)
+        except Exception:
+            exceptions.handle(self.request,
+                              err_msg,
+                              redirect=reverse(INDEX_URL))
+            return {}
+
     class Meta(object):
         name = _("Project Groups")
         slug = PROJECT_GROUP_MEMBER_SLUG
@@ -479,6 +494,10 @@ class CreateProject(workflows.Workflow):
             return message % self.context.get('name', 'unknown project')
         return message
 
+    @memoized.memoized_method
+    def _get_available_roles(self, request):
+        return api.keystone.role_list(request)
+
     def _create_project(self, request, data):
         # create the project
         domain_id = data['domain_id']
@@ -507,7 +526,7 @@ class CreateProject(workflows.Workflow):
         # update project members
         users_to_add = 0
         try:
-            available_roles = api.keystone.role_list(request)
+            available_roles = self._get_available_roles(request)
             member_step = self.get_step(PROJECT_USER_MEMBER_SLUG)
             # count how many users are to be added
             for role in available_roles:
@@ -538,7 +557,7 @@ class CreateProject(workflows.Workflow):
         # update project groups
         groups_to_add = 0
         try:
-            available_roles = api.keystone.role_list(request)
+            available_roles = self._get_available_roles(request)
             member_step = self.get_step(PROJECT_GROUP_MEMBER_SLUG)
 
             # count how many groups are to be added
@@ -714,8 +733,8 @@ class UpdateProject(workflows.Workflow):
         is_current_user = user_id == request.user.id
         is_current_project = project_id == request.user.tenant_id
         _admin_roles = utils.get_admin_roles()
-        available_admin_role_ids = [role.id for role in available_roles
-                                    if role.name.lower() in _admin_roles]
+        available_admin_role_ids = {role.id for role in available_roles
+                                    if role.name.lower() in _admin_roles}
         admin_roles = [role for role in current_role_ids
                        if role in available_admin_role_ids]
         if admin_roles:
@@ -757,11 +776,11 @@ class UpdateProject(workflows.Workflow):
             # supports it, so we may want to add that in the future.
             all_users = api.keystone.user_list(request,
                                                domain=data['domain_id'])
-            users_dict = {user.id: user.name for user in all_users}
+            domain_user_ids = {user.id for user in all_users}
 
             for user_id in users_roles:
                 # Don't remove roles if the user isn't in the domain
-                if user_id not in users_dict:
+                if user_id not in domain_user_ids:
                     users_to_modify -= 1
                     continue
 
@@ -861,10 +880,10 @@ class UpdateProject(workflows.Workflow):
                 field_name = member_step.get_member_field_name(role.id)
                 # Count how many groups may be added for error handling.
                 groups_to_modify += len(data[field_name])
+            project_group_ids = {x.id for x in project_groups}
             for role in available_roles:
                 groups_added = 0
                 field_name = member_step.get_member_field_name(role.id)
-                project_group_ids = [x.id for x in project_groups]
                 for group_id in data[field_name]:
                     if group_id not in project_group_ids:
                         api.keystone.add_group_role(request,
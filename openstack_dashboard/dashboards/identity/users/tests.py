@@ -19,11 +19,13 @@
 from socket import timeout as socket_timeout
 from unittest import mock
 
+from django.conf import settings
 from django.test.utils import override_settings
 from django.urls import reverse
 
 from openstack_dashboard import api
 from openstack_dashboard.dashboards.identity.users import tabs
+from openstack_dashboard.dashboards.identity.users import views
 from openstack_dashboard.test import helpers as test
 
 
@@ -278,6 +280,59 @@ class UsersViewTests(test.BaseAdminViewTests):
             self.mock_get_default_role, 2,
             mock.call(test.IsHttpRequest()))
 
+    @override_settings(OPENSTACK_KEYSTONE_ROLE_CACHE_TTL=60)
+    @mock.patch.object(views, '_ROLE_CACHE', {})
+    @test.create_mocks({api.keystone: ('get_default_domain',
+                                       'tenant_list',
+                                       'role_list',
+                                       'get_default_role')})
+    def test_create_get_with_role_cache(self):
+        domain = self._get_default_domain()
+        roles = self.roles.list()
+
+        self.mock_get_default_domain.return_value = domain
+        self.mock_tenant_list.return_value = [self.tenants.list(), False]
+        self.mock_role_list.return_value = roles
+        self.mock_get_default_role.return_value = self.roles.first()
+
+        for _i in range(2):
+            res = self.client.get(USER_CREATE_URL)
+            self.assertTemplateUsed(res, 'identity/users/create.html')
+            self.assertCountEqual(
+                res.context['form'].fields['role_id'].choices,
+                [(role.id, role.name) for role in roles])
+
+        self.mock_role_list.assert_called_once_with(test.IsHttpRequest())
+        self.assertEqual([settings.OPENSTACK_KEYSTONE_URL],
+                         list(views._ROLE_CACHE))
+
+    @override_settings(OPENSTACK_KEYSTONE_ROLE_CACHE_TTL=60)
+    @mock.patch.object(views, '_ROLE_CACHE', {})
+    @test.create_mocks({api.keystone: ('get_default_domain',
+                                       'tenant_list',
+                                       'role_list',
+                                       'get_default_role')})
+    def test_create_get_with_role_cache_expired(self):
+        domain = self._get_default_domain()
+
+        self.mock_get_default_domain.return_value = domain
+        self.mock_tenant_list.return_value = [self.tenants.list(), False]
+        self.mock_role_list.return_value = self.roles.list()
+        self.mock_get_default_role.return_value = self.roles.first()
+
+        res = self.client.get(USER_CREATE_URL)
+        self.assertTemplateUsed(res, 'identity/users/create.html')
+
+        # Age the cached entry beyond the TTL.
+        views._ROLE_CACHE[settings.OPENSTACK_KEYSTONE_URL]['ts'] -= 61
+
+        res = self.client.get(USER_CREATE_URL)
+        self.assertTemplateUsed(res, 'identity/users/create.html')
+
+        self.assert_mock_multiple_calls_with_same_arguments(
+            self.mock_role_list, 2,
+            mock.call(test.IsHttpRequest()))
+
     @test.create_mocks({api.keystone: ('get_default_domain',
                                        'tenant_list',
                                        'role_list',
@@ -17,7 +17,8 @@
 #    under the License.
 
 import logging
-import operator
+import threading
+import time
 
 from django.conf import settings
 from django.urls import reverse
@@ -47,6 +48,36 @@ from openstack_dashboard.utils import settings as setting_utils
 
 LOG = logging.getLogger(__name__)
 
+# Process-wide cache of the Keystone role list shown in the create user
+# form, keyed by the Keystone endpoint of the user. Only the role IDs and
+# names are kept so that no keystoneclient manager (and so no user token)
+# outlives the request which filled the cache. It is only used when
+# OPENSTACK_KEYSTONE_ROLE_CACHE_TTL is set. The cache is shared by every
+# user of the process, so Keystone does not check the list_roles policy
+# of users served from it.
+_ROLE_CACHE = {}
+_ROLE_CACHE_LOCK = threading.Lock()
+
+
+def _get_role_list(request):
+    # NOTE: The uncached path returns keystoneclient Role objects while the
+    # cached path returns APIDictWrapper objects. CreateUserForm only reads
+    # the id and name attributes of the roles, which both provide.
+    ttl = settings.OPENSTACK_KEYSTONE_ROLE_CACHE_TTL
+    if not ttl:
+        return api.keystone.role_list(request)
+    endpoint = request.user.endpoint
+    with _ROLE_CACHE_LOCK:
+        cached = _ROLE_CACHE.get(endpoint)
+    if cached is None or time.monotonic() - cached['ts'] >= ttl:
+        roles = api.keystone.role_list(request)
+        cached = {'ts': time.monotonic(),
+                  'data': [(role.id, role.name) for role in roles]}
+        with _ROLE_CACHE_LOCK:
+            _ROLE_CACHE[endpoint] = cached
+    return [api.base.APIDictWrapper({'id': role_id, 'name': name})
+            for role_id, name in cached['data']]
+
 
 class IndexView(tables.DataTableView):
     table_class = project_tables.UsersTable
@@ -177,13 +208,14 @@ class CreateView(forms.ModalFormView):
     def get_form_kwargs(self):
         kwargs = super().get_form_kwargs()
         try:
-            roles = api.keystone.role_list(self.request)
+            roles = _get_role_list(self.request)
         except Exception:
             redirect = reverse("horizon:identity:users:index")
             exceptions.handle(self.request,
                               _("Unable to retrieve user roles."),
                               redirect=redirect)
-        roles.sort(key=operator.attrgetter("id"))
+        # NOTE: CreateUserForm orders the role choices by name, so no sort
+        # is needed here.
         kwargs['roles'] = roles
         return kwargs
 
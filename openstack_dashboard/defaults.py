@@ -377,6 +377,10 @@ OPENSTACK_CINDER_FEATURES = {
 # This value must be the name of the domain whose ID is specified there.
 OPENSTACK_KEYSTONE_DEFAULT_DOMAIN = 'Default'
 OPENSTACK_KEYSTONE_DEFAULT_ROLE = 'member'
+# The number of seconds the role list shown in the create user form is cached
+# in each Horizon process. Set to 0 to retrieve the roles from Keystone on
+# every request.
+OPENSTACK_KEYSTONE_ROLE_CACHE_TTL = 0
 # The OPENSTACK_KEYSTONE_BACKEND settings can be used to identify the
 # capabilities of the auth backend for Keystone.
 # If Keystone has been configured to use LDAP as the auth backend then set